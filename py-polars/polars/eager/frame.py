@@ -1,6 +1,7 @@
 """
 Module containing logic related to eager DataFrames
 """
+import gzip
 import os
 import typing as tp
 from io import BytesIO, StringIO
@@ -46,6 +47,21 @@ try:
 except ImportError:
     pass
 
+# file objects that decompress on read; bz2 and lzma are not available in every python build.
+_DECOMPRESSING_FILES: Tuple[type, ...] = (gzip.GzipFile,)
+try:
+    import bz2
+
+    _DECOMPRESSING_FILES += (bz2.BZ2File,)
+except ImportError:
+    pass
+try:
+    import lzma
+
+    _DECOMPRESSING_FILES += (lzma.LZMAFile,)
+except ImportError:
+    pass
+
 __all__ = [
     "DataFrame",
     "wrap_df",
@@ -54,6 +70,10 @@ __all__ = [
 ]
 
 
+# arrow types of python values that `PyDataFrame.read_rows` also reads as the same polars type.
+_FROM_ROWS_ARROW_TYPES = {pa.int64(), pa.float64(), pa.string()}
+
+
 def wrap_df(df: "PyDataFrame") -> "DataFrame":
     return DataFrame._from_pydf(df)
 
@@ -152,9 +172,31 @@ class DataFrame:
             ```
         """
         self = DataFrame.__new__(DataFrame)
-        self._df = PyDataFrame.read_rows(rows)
-        if column_names is not None:
-            self.columns = column_names
+        arrays = None
+        if (
+            column_names is not None
+            and len(rows) > 0
+            and all(len(row) == len(column_names) for row in rows)
+        ):
+            # transpose to columns, so that the type is inferred once per column
+            # instead of once per value.
+            try:
+                arrays = [pa.array(column) for column in zip(*rows)]
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                pass
+
+        # Only use the arrow arrays for types that `read_rows` infers the same way. That excludes e.g. booleans
+        # (Int64 in `read_rows`), datetimes (local time in `read_rows`) and all None columns (Boolean in `read_rows`).
+        # Float columns that contain None or ints are not supported by `read_rows`, but are read here.
+        if arrays is not None and all(
+            arr.type in _FROM_ROWS_ARROW_TYPES for arr in arrays
+        ):
+            tbl = pa.Table.from_arrays(arrays, names=column_names)
+            self._df = DataFrame.from_arrow(tbl)._df
+        else:
+            self._df = PyDataFrame.read_rows(rows)
+            if column_names is not None:
+                self.columns = column_names
         if column_name_mapping is not None:
             for i, name in column_name_mapping.items():
                 s = self[:, i]
@@ -181,6 +223,7 @@ class DataFrame:
         low_memory: bool = False,
         comment_char: Optional[str] = None,
         null_values: Optional[Union[str, tp.List[str], Dict[str, str]]] = None,
+        new_columns: Optional[tp.List[str]] = None,
     ) -> "DataFrame":
         """
         Read a CSV file into a Dataframe.
@@ -228,6 +271,9 @@ class DataFrame:
             - str -> all values encountered equal to this string will be null
             - tp.List[str] -> A null value per column.
             - Dict[str, str] -> A dictionary that maps column name to a null value string.
+        new_columns
+            Rename columns to these right after parsing. Note that the length of this list must equal the width of the
+            DataFrame that's parsed.
 
         Example
         ---
@@ -250,6 +296,10 @@ class DataFrame:
                 file = file.getvalue()
             if isinstance(file, StringIO):
                 file = file.getvalue().encode()
+            # a decompressing file object (e.g. opened by fsspec): decompress in a single call
+            # instead of having the parser pull small buffers through python.
+            if isinstance(file, _DECOMPRESSING_FILES):
+                file = file.read()
 
         dtype_list: Optional[tp.List[Tuple[str, Type[DataType]]]] = None
         if dtype is not None:
@@ -278,6 +328,7 @@ class DataFrame:
             low_memory,
             comment_char,
             processed_null_values,
+            new_columns,
         )
         return self
 
@@ -311,7 +362,9 @@ class DataFrame:
         return self
 
     @staticmethod
-    def read_ipc(file: Union[str, BinaryIO], use_pyarrow: bool = True) -> "DataFrame":
+    def read_ipc(
+        file: Union[str, BinaryIO], use_pyarrow: bool = True, memory_map: bool = True
+    ) -> "DataFrame":
         """
         Read into a DataFrame from Arrow IPC stream format. This is also called the feather format.
 
@@ -321,13 +374,15 @@ class DataFrame:
             Path to a file or a file like object.
         use_pyarrow
             Use pyarrow or rust arrow backend.
+        memory_map
+            Memory map the file if a path is given. Only used by the pyarrow backend.
 
         Returns
         -------
         DataFrame
         """
         if use_pyarrow:
-            tbl = pa.feather.read_table(file)
+            tbl = pa.feather.read_table(file, memory_map=memory_map)
             return DataFrame.from_arrow(tbl)
 
         self = DataFrame.__new__(DataFrame)
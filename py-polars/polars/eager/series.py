@@ -278,9 +278,9 @@ class Series:
         return self
 
     @staticmethod
-    def _repeat(name: str, val: str, n: int) -> "Series":
+    def _repeat(name: str, val: Union[int, float, str, bool], n: int) -> "Series":
         """
-        Only used for strings.
+        Used by `pl.repeat`. Fills a new Series with `val` directly in Rust.
         """
         return Series._from_pyseries(PySeries.repeat(name, val, n))
 
@@ -1,5 +1,8 @@
+import gzip
+import os
 from contextlib import contextmanager
-from io import BytesIO, StringIO
+from functools import lru_cache
+from io import BufferedReader, BytesIO, RawIOBase, StringIO
 from pathlib import Path
 from typing import (
     Any,
@@ -25,8 +28,10 @@ import pyarrow.parquet
 
 try:
     import pandas as pd
+
+    WITH_PANDAS = True
 except ImportError:
-    pass
+    WITH_PANDAS = False
 
 try:
     import fsspec
@@ -37,8 +42,18 @@ try:
 except ImportError:
     WITH_FSSPEC = False
 
+try:
+    import connectorx as cx
+
+    WITH_CONNECTORX = True
+except ImportError:
+    WITH_CONNECTORX = False
+
 import polars as pl
 
+# url schemes of the databases connectorx can read from
+_CONNECTORX_SCHEMES = {"postgres", "postgresql", "mysql", "mssql", "oracle", "redshift"}
+
 __all__ = [
     "get_dummies",
     "concat",
@@ -58,11 +73,54 @@ __all__ = [
 ]
 
 
-def _process_http_file(path: str) -> BytesIO:
+def _process_http_file(
+    path: str, stream: bool = False
+) -> Union[BytesIO, BufferedReader]:
+    if stream:
+        # Read the response lazily, so that the consumer can parse while the file is downloading.
+        # Note that the returned file is not seekable.
+        return BufferedReader(urlopen(path), buffer_size=1 << 20)  # type: ignore[arg-type]
     with urlopen(path) as f:
         return BytesIO(f.read())
 
 
+def _process_gzip_file(path: str) -> BytesIO:
+    with gzip.open(path, "rb") as f:
+        return BytesIO(f.read())
+
+
+class _StringIOAsBytes(RawIOBase):
+    """
+    Binary, read-only view on a `StringIO` that encodes to utf8 as it is being read.
+    This saves a full copy of the data compared to `BytesIO(file.read().encode("utf8"))`.
+    """
+
+    def __init__(self, inner: StringIO):
+        self.inner = inner
+        self.pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        size = len(buffer)
+        if not self.pending:
+            # a character takes at most 4 bytes in utf8
+            self.pending = self.inner.read(max(1, size // 4)).encode("utf8")
+        n = min(size, len(self.pending))
+        buffer[:n] = self.pending[:n]
+        self.pending = self.pending[n:]
+        return n
+
+
+@lru_cache(maxsize=256)
+def _is_local_file(file: str) -> bool:
+    # Paths without a scheme separator can't point to remote storage; skip fsspec's url parsing.
+    if "://" not in file:
+        return True
+    return infer_storage_options(file)["protocol"] == "file"
+
+
 @overload
 def _prepare_file_arg(
     file: Union[str, List[str], Path, BinaryIO], **kwargs: Any
@@ -93,7 +151,9 @@ def _prepare_file_arg(
 
     A `StringIO`, `BytesIO` file is returned as a `BytesIO`
     A local path is returned as a string
-    An http url is read into a buffer and returned as a `BytesIO`
+    An http url is read into a buffer and returned as a `BytesIO`, or, if `stream_http=True`,
+    returned as a (not seekable) `BufferedReader` over the response
+    A gzip compressed local file is decompressed into a buffer and returned as a `BytesIO`
 
     When fsspec is installed, except for `StringIO`, `BytesIO` and local
     uncompressed files, the file is opened with `fsspec.open(file, **kwargs)`,
@@ -101,6 +161,7 @@ def _prepare_file_arg(
     """
 
     compression = kwargs.pop("compression", "infer")
+    stream_http = kwargs.pop("stream_http", False)
 
     # Small helper to use a variable as context
     @contextmanager
@@ -119,16 +180,18 @@ def _prepare_file_arg(
     if isinstance(file, str):
         if WITH_FSSPEC:
             compressed = infer_compression(file) is not None
-            local = infer_storage_options(file)["protocol"] == "file"
+            local = _is_local_file(file)
             if local and not compressed:
                 return managed_file(make_path_posix(file))
             return fsspec.open(file, compression=compression, **kwargs)
         if file.startswith("http"):
-            return _process_http_file(file)
+            return _process_http_file(file, stream_http)
+        if file.endswith(".gz"):
+            return _process_gzip_file(file)
     if isinstance(file, list) and bool(file) and all(isinstance(f, str) for f in file):
         if WITH_FSSPEC:
             compressed = any(infer_compression(f) is not None for f in file)
-            local = all(infer_storage_options(f)["protocol"] == "file" for f in file)
+            local = all(map(_is_local_file, file))
             if local and not compressed:
                 return managed_file(list(map(make_path_posix, file)))
             return fsspec.open_files(file, compression=compression, **kwargs)
@@ -208,6 +271,7 @@ def read_csv(
         - "utf8-lossy"
     n_threads
         Number of threads to use in csv parsing. Defaults to the number of physical cpu's of your system.
+        Setting this disables ``use_pyarrow``, unless it is set to 1, which makes pyarrow's parser single threaded.
     dtype
         Overwrite the dtypes during inference.
     new_columns
@@ -249,30 +313,54 @@ def read_csv(
         use_pyarrow
         and dtype is None
         and stop_after_n_rows is None
-        and n_threads is None
+        # pyarrow's thread pool size is a process wide setting, so we can only choose between
+        # single threaded and using the whole pool.
+        and (n_threads is None or n_threads == 1)
         and encoding == "utf8"
         and not low_memory
         and null_values is None
     ):
         include_columns = None
+        # Final column names if the CSV file does not contain a header and a selection is made.
+        headerless_columns = None
 
         if columns:
             if not has_headers:
                 # Convert 'column_1', 'column_2', ... column names to 'f0', 'f1', ... column names for pyarrow,
                 # if CSV file does not contain a header.
                 include_columns = [f"f{int(column[7:]) - 1}" for column in columns]
+                headerless_columns = columns
             else:
                 include_columns = columns
 
         if not columns and projection:
             # Convert column indices from projection to 'f0', 'f1', ... column names for pyarrow.
-            include_columns = [f"f{column_idx}" for column_idx in projection]
+            include_columns = list(map("f{}".format, projection))
+            if not has_headers:
+                headerless_columns = [
+                    f"column_{column_idx + 1}" for column_idx in projection
+                ]
+
+        column_names = None
+        if new_columns and include_columns is None:
+            # Let pyarrow name the columns while parsing. If the file has a header, it is skipped.
+            column_names = new_columns
+
+        if isinstance(file, StringIO):
+            # pyarrow reads the file in blocks; encode them on the fly.
+            file = BufferedReader(_StringIOAsBytes(file))
 
-        with _prepare_file_arg(file, **storage_options) as data:
+        # pyarrow reads the file in blocks and doesn't need to seek, so it can stream http files.
+        with _prepare_file_arg(file, stream_http=True, **storage_options) as data:
             tbl = pa.csv.read_csv(
                 data,
                 pa.csv.ReadOptions(
-                    skip_rows=skip_rows, autogenerate_column_names=not has_headers
+                    skip_rows=skip_rows + 1
+                    if column_names is not None and has_headers
+                    else skip_rows,
+                    column_names=column_names,
+                    autogenerate_column_names=not has_headers,
+                    use_threads=n_threads != 1,
                 ),
                 pa.csv.ParseOptions(delimiter=sep),
                 pa.csv.ConvertOptions(
@@ -283,12 +371,15 @@ def read_csv(
             )
 
         if new_columns:
-            tbl = tbl.rename_columns(new_columns)
+            if column_names is None:
+                tbl = tbl.rename_columns(new_columns)
         elif not has_headers:
-            # Rename 'f0', 'f1', ... columns names autogenated by pyarrow to 'column_1', 'column_2', ...
-            tbl = tbl.rename_columns(
-                [f"column_{int(column[1:]) + 1}" for column in tbl.column_names]
-            )
+            if headerless_columns is None:
+                # All columns are read: 'f0', 'f1', ... autogenerated by pyarrow become 'column_1', 'column_2', ...
+                headerless_columns = list(
+                    map("column_{}".format, range(1, tbl.num_columns + 1))
+                )
+            tbl = tbl.rename_columns(headerless_columns)
 
         return from_arrow(tbl, rechunk)  # type: ignore[return-value]
 
@@ -311,10 +402,8 @@ def read_csv(
             low_memory=low_memory,
             comment_char=comment_char,
             null_values=null_values,
+            new_columns=new_columns,
         )
-
-    if new_columns:
-        df.columns = new_columns
     return df
 
 
@@ -416,6 +505,7 @@ def read_ipc(
     file: Union[str, BinaryIO, Path],
     use_pyarrow: bool = True,
     storage_options: Optional[Dict] = None,
+    memory_map: bool = True,
 ) -> "pl.DataFrame":
     """
     Read into a DataFrame from Arrow IPC stream format. This is also called the feather format.
@@ -429,14 +519,27 @@ def read_ipc(
         Use pyarrow or rust arrow backend.
     storage_options
         Extra options that make sense for ``fsspec.open()`` or a particular storage connection, e.g. host, port, username, password, etc.
+        These are ignored if ``file`` is a local, uncompressed file, as that is read directly.
+    memory_map
+        Memory map underlying file. This will likely increase performance.
+        Only used when ``use_pyarrow=True``.
 
     Returns
     -------
     DataFrame
     """
+    if isinstance(file, (str, Path)):
+        file = str(file)
+        compressed = file.endswith(".gz") or (
+            WITH_FSSPEC and infer_compression(file) is not None
+        )
+        if not compressed and os.path.isfile(file):
+            # local uncompressed file: let the reader open (and memory map) it directly.
+            return pl.DataFrame.read_ipc(file, use_pyarrow, memory_map)
+
     storage_options = storage_options or {}
     with _prepare_file_arg(file, **storage_options) as data:
-        return pl.DataFrame.read_ipc(data, use_pyarrow)
+        return pl.DataFrame.read_ipc(data, use_pyarrow, memory_map)
 
 
 def read_parquet(
@@ -519,22 +622,26 @@ def from_arrow_table(table: pa.Table, rechunk: bool = True) -> "pl.DataFrame":
 
 
 def from_arrow(
-    a: Union[pa.Table, pa.Array], rechunk: bool = True
+    a: Union[pa.Table, pa.Array, pa.ChunkedArray], rechunk: bool = True
 ) -> Union["pl.DataFrame", "pl.Series"]:
     """
-    Create a DataFrame from an arrow Table.
+    Create a DataFrame from an arrow Table, or a Series from an arrow (Chunked)Array.
 
     Parameters
     ----------
     a
-        Arrow Table.
+        Arrow Table, Array or ChunkedArray.
     rechunk
         Make sure that all data is contiguous.
     """
-    if isinstance(a, pa.Table):
+    # all read functions end up here; `type(a) is` is a cheaper check than `isinstance`.
+    # Arrays are instances of a type specific subclass of `pa.Array`, so those still need `isinstance`.
+    if type(a) is pa.Table:
         return pl.DataFrame.from_arrow(a, rechunk)
     elif isinstance(a, pa.Array):
         return pl.Series.from_arrow("", a)
+    elif isinstance(a, pa.ChunkedArray):
+        return pl.Series.from_arrow("", a.combine_chunks())
     else:
         raise ValueError(f"expected arrow table / array, got {a}")
 
@@ -542,13 +649,25 @@ def from_arrow(
 def _from_pandas_helper(a: "pd.Series") -> pa.Array:  # noqa: F821
     dtype = a.dtype
     if dtype == "datetime64[ns]":
-        # We first cast to ms because that's the unit of Date64,
-        # Then we cast to via int64 to date64. Casting directly to Date64 lead to
+        # Date64 is in ms since the epoch, so we convert ns to ms in a single numpy pass and
+        # let arrow use that buffer as Date64 directly. Casting datetimes directly to Date64 lead to
         # loss of time information https://github.com/ritchie46/polars/issues/476
-        arr = pa.array(np.array(a.values, dtype="datetime64[ms]"))
-        arr = pa.compute.cast(arr, pa.int64())
-        return pa.compute.cast(arr, pa.date64())
-    elif dtype == "object" and isinstance(a.iloc[0], str):
+        values = a.values
+        ms = values.view("i8") // 1_000_000
+        mask = np.isnat(values)
+        return pa.array(ms, pa.date64(), mask=mask if mask.any() else None)
+    elif dtype.kind in "iufb":
+        # numeric and boolean columns are backed by a contiguous numpy buffer, which arrow
+        # can wrap without copying if there are no missing values.
+        return pa.Array.from_pandas(a.values)
+    elif dtype == "object":
+        # index the underlying numpy array directly; this skips the pandas indexing machinery.
+        values = a.values
+        if len(values) > 0 and isinstance(values[0], str):
+            return pa.array(a, pa.large_utf8())
+        return pa.array(a)
+    elif dtype.name == "string":
+        # pandas' extension string dtype
         return pa.array(a, pa.large_utf8())
     else:
         return pa.array(a)
@@ -575,6 +694,11 @@ def from_pandas(
     if isinstance(df, pd.Series) or isinstance(df, pd.DatetimeIndex):
         return from_arrow(_from_pandas_helper(df))
 
+    # Only numeric and boolean columns: let pyarrow convert all columns in one (multithreaded) call.
+    if all(dtype.kind in "iufb" for dtype in df.dtypes):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return from_arrow(table, rechunk)
+
     # Note: we first tried to infer the schema via pyarrow and then modify the schema if needed.
     # However arrow 3.0 determines the type of a string like this:
     #       pa.array(array).type
@@ -601,21 +725,11 @@ def concat(dfs: Sequence["pl.DataFrame"], rechunk: bool = True) -> "pl.DataFrame
         rechunk the final DataFrame.
     """
     assert len(dfs) > 0
-    df = dfs[0].clone()
-    for i in range(1, len(dfs)):
-        try:
-            df = df.vstack(dfs[i], in_place=False)  # type: ignore[assignment]
-        # could have a double borrow (one mutable one ref)
-        except RuntimeError:
-            df.vstack(dfs[i].clone(), in_place=True)
-
-    if rechunk:
-        return df.rechunk()
-    return df
+    return pl.wrap_df(dfs[0]._df.vstack_many([df._df for df in dfs[1:]], rechunk))
 
 
 def repeat(
-    val: Union[int, float, str], n: int, name: Optional[str] = None
+    val: Union[int, float, str, bool], n: int, name: Optional[str] = None
 ) -> "pl.Series":
     """
     Repeat a single value n times and collect into a Series.
@@ -631,12 +745,10 @@ def repeat(
     """
     if name is None:
         name = ""
-    if isinstance(val, str):
-        s = pl.Series._repeat(name, val, n)
-        s.rename(name)
-        return s
-    else:
-        return pl.Series.from_arrow(name, pa.repeat(val, n))
+    if isinstance(val, np.generic):
+        # numpy scalars to their python counterpart, e.g. np.bool_ -> bool
+        val = val.item()
+    return pl.Series._repeat(name, val, n)
 
 
 def read_json(source: Union[str, BytesIO]) -> "pl.DataFrame":
@@ -676,6 +788,15 @@ def from_rows(
     return pl.DataFrame.from_rows(rows, column_names, column_name_mapping)
 
 
+def _is_connectorx_conn(engine: Any) -> bool:
+    """
+    Whether `engine` is a connection string for a database connectorx can read from.
+    sqlalchemy engines are not handed to connectorx, as it would ignore their connect_args, creator, pool and
+    execution options.
+    """
+    return isinstance(engine, str) and engine.split("://", 1)[0] in _CONNECTORX_SCHEMES
+
+
 def read_sql(sql: str, engine: Any) -> "pl.DataFrame":
     """
     # Preface
@@ -694,24 +815,36 @@ def read_sql(sql: str, engine: Any) -> "pl.DataFrame":
     Load a DataFrame from a database by sending a raw sql query.
     Make sure to install sqlalchemy ^1.4
 
+    If ``connectorx`` is installed and `engine` is a connection string of a database it supports, it is used to load
+    the query result directly into arrow memory. sqlalchemy engines are always read through the engine itself.
+
     Parameters
     ----------
     sql
         raw sql query
     engine : sqlalchemy engine
         make sure to install sqlalchemy ^1.4
+        A connection string is also accepted.
+        An ADBC (dbapi) connection is also accepted, in which case the result is fetched as an arrow table.
     """
-    try:
+    # ADBC connections can hand over the result as arrow data in one go.
+    if hasattr(engine, "adbc_get_info"):
+        with engine.cursor() as cursor:
+            cursor.execute(sql)
+            return from_arrow(cursor.fetch_arrow_table())  # type: ignore[return-value]
+
+    if WITH_CONNECTORX and _is_connectorx_conn(engine):
+        return from_arrow(cx.read_sql(engine, sql, return_type="arrow"))  # type: ignore[return-value]
+
+    if WITH_PANDAS:
         # pandas sql loading is faster.
         # conversion from pandas to arrow is very cheap compared to db driver
-        import pandas as pd
-
         return from_pandas(pd.read_sql(sql, engine))  # type: ignore[return-value]
-    except ImportError:
-        from sqlalchemy import text
 
-        with engine.connect() as con:
-            result = con.execute(text(sql))
+    from sqlalchemy import text
+
+    with engine.connect() as con:
+        result = con.execute(text(sql))
 
-        rows = result.fetchall()
-        return from_rows(rows, list(result.keys()))
+    rows = result.fetchall()
+    return from_rows(rows, list(result.keys()))
@@ -79,6 +79,7 @@ impl PyDataFrame {
         low_memory: bool,
         comment_char: Option<&str>,
         null_values: Option<Wrap<NullValues>>,
+        new_columns: Option<Vec<String>>,
     ) -> PyResult<Self> {
         let null_values = null_values.map(|w| w.0);
         let comment_char = comment_char.map(|s| s.as_bytes()[0]);
@@ -105,7 +106,7 @@ impl PyDataFrame {
         });
 
         let mmap_bytes_r = get_mmap_bytes_reader(py_f)?;
-        let df = CsvReader::new(mmap_bytes_r)
+        let mut df = CsvReader::new(mmap_bytes_r)
             .infer_schema(Some(infer_schema_length))
             .has_header(has_header)
             .with_stop_after_n_rows(stop_after_n_rows)
@@ -125,6 +126,9 @@ impl PyDataFrame {
             .with_null_values(null_values)
             .finish()
             .map_err(PyPolarsEr::from)?;
+        if let Some(names) = new_columns {
+            df.set_column_names(&names).map_err(PyPolarsEr::from)?;
+        }
         Ok(df.into())
     }
 
@@ -466,6 +470,17 @@ impl PyDataFrame {
         Ok(df.into())
     }
 
+    pub fn vstack_many(&self, dfs: Vec<PyDataFrame>, rechunk: bool) -> PyResult<Self> {
+        let mut df = self.df.clone();
+        for other in &dfs {
+            df.vstack_mut(&other.df).map_err(PyPolarsEr::from)?;
+        }
+        if rechunk {
+            df = df.agg_chunks();
+        }
+        Ok(df.into())
+    }
+
     pub fn drop_in_place(&mut self, name: &str) -> PyResult<PySeries> {
         let s = self.df.drop_in_place(name).map_err(PyPolarsEr::from)?;
         Ok(PySeries { series: s })
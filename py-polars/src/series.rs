@@ -1,8 +1,12 @@
 use std::ops::{BitAnd, BitOr};
 
 use numpy::PyArray1;
-use pyo3::types::{PyList, PyTuple};
-use pyo3::{exceptions::PyRuntimeError, prelude::*, Python};
+use pyo3::types::{PyBool, PyFloat, PyInt, PyList, PyString, PyTuple};
+use pyo3::{
+    exceptions::{PyRuntimeError, PyTypeError},
+    prelude::*,
+    Python,
+};
 
 use polars::chunked_array::builder::get_bitmap;
 
@@ -173,10 +177,25 @@ impl PySeries {
     }
 
     #[staticmethod]
-    pub fn repeat(name: &str, val: &str, n: usize) -> Self {
-        let mut ca: Utf8Chunked = (0..n).map(|_| val).collect();
-        ca.rename(name);
-        ca.into_series().into()
+    pub fn repeat(name: &str, val: &PyAny, n: usize) -> PyResult<Self> {
+        // order is important as booleans are instance of int in python.
+        let s = if let Ok(val) = val.downcast::<PyBool>() {
+            BooleanChunked::full(name, val.is_true(), n).into_series()
+        } else if let Ok(val) = val.downcast::<PyString>() {
+            Utf8Chunked::full(name, val.to_str()?, n).into_series()
+        } else if let Ok(val) = val.downcast::<PyInt>() {
+            let val = val.extract::<i64>().map_err(|_| {
+                PyTypeError::new_err("could not repeat int value: it does not fit in an Int64")
+            })?;
+            Int64Chunked::full(name, val, n).into_series()
+        } else if let Ok(val) = val.downcast::<PyFloat>() {
+            Float64Chunked::full(name, val.value(), n).into_series()
+        } else {
+            return Err(PyTypeError::new_err(
+                "could not repeat value: expected a bool, int, float or str",
+            ));
+        };
+        Ok(s.into())
     }
 
     #[staticmethod]
@@ -711,6 +711,28 @@ def test_from_rows():
     )
     assert df.dtypes == [pl.Int64, pl.Date64]
 
+    # with column names, float columns may contain None or ints; `read_rows` can't read these
+    df = pl.from_rows(
+        [[1, 2.0, "foo", 1], [2, None, "bar", 2.5]], column_names=["a", "b", "c", "d"]
+    )
+    assert df.frame_equal(
+        pl.DataFrame(
+            {"a": [1, 2], "b": [2.0, None], "c": ["foo", "bar"], "d": [1.0, 2.5]}
+        ),
+        null_equal=True,
+    )
+
+    # otherwise, passing column names should not change the inferred types or values
+    rows = [
+        [1, True, datetime.fromtimestamp(100), None],
+        [2, False, datetime.fromtimestamp(2398754908), None],
+    ]
+    df = pl.from_rows(rows, column_names=["a", "b", "c", "d"])
+    assert df.dtypes == [pl.Int64, pl.Int64, pl.Date64, pl.Boolean]
+    expected = pl.from_rows(rows)
+    expected.columns = ["a", "b", "c", "d"]
+    assert df.frame_equal(expected, null_equal=True)
+
 
 def test_repeat_by():
     df = pl.DataFrame({"name": ["foo", "bar"], "n": [2, 3]})
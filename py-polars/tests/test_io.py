@@ -1,7 +1,11 @@
+import gzip
 import io
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
 
 import polars as pl
 
@@ -24,6 +28,45 @@ def test_read_web_file():
     url = "https://raw.githubusercontent.com/ritchie46/polars/master/examples/aggregate_multiple_files_in_chunks/datasets/foods1.csv"
     df = pl.read_csv(url)
     assert df.shape == (27, 4)
+    df = pl.read_csv(url, use_pyarrow=True)
+    assert df.shape == (27, 4)
+
+
+def test_read_http_file_without_fsspec(monkeypatch):
+    import polars.functions
+
+    csv = b"a,b\n1,foo\n2,bar\n"
+    urls = []
+
+    class Response(io.RawIOBase):
+        # like a http response, this file is not seekable
+        def __init__(self):
+            self.data = io.BytesIO(csv)
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return self.data.readinto(b)
+
+    def urlopen(url):
+        urls.append(url)
+        return Response()
+
+    monkeypatch.setattr(polars.functions, "WITH_FSSPEC", False)
+    monkeypatch.setattr(polars.functions, "urlopen", urlopen)
+
+    url = "http://localhost/data.csv"
+    expected = pl.DataFrame({"a": [1, 2], "b": ["foo", "bar"]})
+    for use_pyarrow in [False, True]:
+        df = pl.read_csv(url, use_pyarrow=use_pyarrow)
+        assert df.frame_equal(expected)
+    assert urls == [url, url]
+
+    # the response is streamed to the pyarrow parser instead of being read into memory first
+    with polars.functions._prepare_file_arg(url, stream_http=True) as data:
+        assert isinstance(data, io.BufferedReader)
+        assert not data.seekable()
 
 
 def test_parquet_chunks():
@@ -107,3 +150,202 @@ a,n/a,c"""
     df = pl.read_csv(f, null_values={"a": "na", "b": "n/a"})
     assert df[0, "a"] is None
     assert df[1, "b"] is None
+
+
+def test_read_csv_gzip(tmp_path):
+    path = str(tmp_path / "data.csv.gz")
+    with gzip.open(path, "wb") as f:
+        f.write(b"a,b\n1,foo\n2,bar\n")
+
+    df = pl.read_csv(path)
+    assert df.shape == (2, 2)
+    assert df["b"].to_list() == ["foo", "bar"]
+
+
+def test_read_parquet_list(tmp_path):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["foo", "bar", "ham"]})
+    paths = []
+    for i in range(3):
+        path = str(tmp_path / f"{i}.parquet")
+        df.to_parquet(path)
+        paths.append(path)
+
+    out = pl.read_parquet(paths)
+    assert out.shape == (9, 2)
+    assert out.frame_equal(pl.concat([df, df, df]))
+
+
+def test_read_parquet_list_schema_differs(tmp_path):
+    path_a = str(tmp_path / "a.parquet")
+    path_b = str(tmp_path / "b.parquet")
+    pq.write_table(pa.table({"a": pa.array([1, 2], pa.int64())}), path_a)
+    pq.write_table(
+        pa.table({"a": pa.array([3, 4], pa.int32()), "b": ["foo", "bar"]}), path_b
+    )
+
+    # the files are read as one dataset, using the schema of the first file
+    out = pl.read_parquet([path_a, path_b])
+    assert out.columns == ["a"]
+    assert out["a"].dtype == pl.Int64
+    assert out["a"].to_list() == [1, 2, 3, 4]
+
+
+def test_read_ipc_path(tmp_path):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["foo", "bar", "ham"]})
+    path = tmp_path / "data.ipc"
+    df.to_ipc(str(path))
+
+    assert pl.read_ipc(path).frame_equal(df)
+    assert pl.read_ipc(str(path), memory_map=False).frame_equal(df)
+
+
+def test_read_csv_pyarrow_stringio():
+    csv = "a,b\n" + "".join(f"{i},héllo\n" for i in range(1000))
+    df = pl.read_csv(io.StringIO(csv), use_pyarrow=True)
+    assert df.shape == (1000, 2)
+    assert df[999, "b"] == "héllo"
+
+
+def test_read_csv_pyarrow_no_headers():
+    csv = "1,foo,1.0\n2,bar,2.0\n"
+    df = pl.read_csv(io.StringIO(csv), has_headers=False, use_pyarrow=True)
+    assert df.columns == ["column_1", "column_2", "column_3"]
+
+    df = pl.read_csv(
+        io.StringIO(csv), has_headers=False, projection=[0, 2], use_pyarrow=True
+    )
+    assert df.columns == ["column_1", "column_3"]
+
+    df = pl.read_csv(
+        io.StringIO(csv), has_headers=False, columns=["column_2"], use_pyarrow=True
+    )
+    assert df.columns == ["column_2"]
+    assert df["column_2"].to_list() == ["foo", "bar"]
+
+
+def test_read_csv_pyarrow_n_threads():
+    # pyarrow infers dates, the polars parser reads them as strings
+    csv = "a,b\n1,2021-01-01\n2,2021-01-02\n"
+    df = pl.read_csv(io.StringIO(csv), n_threads=1, use_pyarrow=True)
+    assert df.dtypes == [pl.Int64, pl.Date32]
+    # other thread counts are only supported by the polars parser
+    df = pl.read_csv(io.StringIO(csv), n_threads=2, use_pyarrow=True)
+    assert df.dtypes == [pl.Int64, pl.Utf8]
+
+
+def test_read_csv_new_columns():
+    csv = "a,b\n1,foo\n2,bar\n"
+    for use_pyarrow in [False, True]:
+        df = pl.read_csv(
+            io.StringIO(csv), new_columns=["x", "y"], use_pyarrow=use_pyarrow
+        )
+        assert df.columns == ["x", "y"]
+        assert df["x"].to_list() == [1, 2]
+
+        df = pl.read_csv(
+            io.StringIO(csv),
+            has_headers=False,
+            new_columns=["x", "y"],
+            use_pyarrow=use_pyarrow,
+        )
+        assert df.columns == ["x", "y"]
+        assert df.height == 3
+
+
+def test_read_csv_gzip_fsspec(tmp_path):
+    fsspec = pytest.importorskip("fsspec")
+
+    path = str(tmp_path / "data.csv.gz")
+    with gzip.open(path, "wb") as f:
+        f.write(b"a,b\n1,foo\n2,bar\n")
+
+    with fsspec.open(path, compression="infer") as f:
+        assert isinstance(f, gzip.GzipFile)
+        df = pl.DataFrame.read_csv(f)
+    assert df.shape == (2, 2)
+    assert df["b"].to_list() == ["foo", "bar"]
+
+
+def test_read_ipc_gzip(tmp_path):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["foo", "bar", "ham"]})
+    f = io.BytesIO()
+    df.to_ipc(f)
+    path = str(tmp_path / "data.ipc.gz")
+    with gzip.open(path, "wb") as gz:
+        gz.write(f.getvalue())
+
+    assert pl.read_ipc(path).frame_equal(df)
+
+
+def test_read_sql_connectorx(monkeypatch):
+    import sqlite3
+    from types import SimpleNamespace
+
+    import polars.functions
+
+    calls = []
+
+    def read_sql(conn, sql, return_type):
+        calls.append(conn)
+        return pa.table({"a": [1, 2]})
+
+    monkeypatch.setattr(polars.functions, "WITH_CONNECTORX", True)
+    monkeypatch.setattr(
+        polars.functions, "cx", SimpleNamespace(read_sql=read_sql), raising=False
+    )
+
+    df = pl.read_sql("SELECT a FROM t", "postgresql://user:pw@host/db")
+    assert calls == ["postgresql://user:pw@host/db"]
+    assert df["a"].to_list() == [1, 2]
+
+    # connectables connectorx can't read from fall back to pandas
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE t (a INTEGER)")
+    con.execute("INSERT INTO t VALUES (3), (4)")
+    df = pl.read_sql("SELECT a FROM t", con)
+    assert calls == ["postgresql://user:pw@host/db"]
+    assert df["a"].to_list() == [3, 4]
+
+    # sqlalchemy engines keep their connection options, so they are never handed to connectorx
+    engine = SimpleNamespace(url="postgresql://user:pw@host/db")
+    engines = []
+
+    def pd_read_sql(sql, engine):
+        engines.append(engine)
+        return pd.DataFrame({"a": [5, 6]})
+
+    monkeypatch.setattr(pd, "read_sql", pd_read_sql)
+    df = pl.read_sql("SELECT a FROM t", engine)
+    assert calls == ["postgresql://user:pw@host/db"]
+    assert engines == [engine]
+    assert df["a"].to_list() == [5, 6]
+
+
+def test_read_sql_adbc():
+    events = []
+
+    class Cursor:
+        def __enter__(self):
+            events.append("enter")
+            return self
+
+        def __exit__(self, *args):
+            events.append("exit")
+
+        def execute(self, sql):
+            events.append(sql)
+
+        def fetch_arrow_table(self):
+            events.append("fetch")
+            return pa.table({"a": [1, 2], "b": ["foo", "bar"]})
+
+    class Connection:
+        def adbc_get_info(self):
+            return {}
+
+        def cursor(self):
+            return Cursor()
+
+    df = pl.read_sql("SELECT a, b FROM t", Connection())
+    assert events == ["enter", "SELECT a, b FROM t", "fetch", "exit"]
+    assert df.frame_equal(pl.DataFrame({"a": [1, 2], "b": ["foo", "bar"]}))
@@ -13,6 +13,9 @@ def test_from_pandas_datetime():
     assert s.dt.minute()[0] == 20
     assert s.dt.second()[0] == 20
 
+    s = pl.from_pandas(pd.Series([ts, None]))
+    assert s.null_count() == 1
+
     date_times = pd.date_range(
         "2021-06-24 00:00:00", "2021-06-24 10:00:00", freq="1H", closed="left"
     )
@@ -25,3 +28,26 @@ def test_from_pandas_datetime():
 
     # checks lazy dispatch
     pl.DataFrame([s.rename("foo")])[pl.col("foo").dt.round("hour", 2)]
+
+
+def test_from_pandas_numeric():
+    df = pd.DataFrame(
+        {"ints": [1, 2, 3], "floats": [1.0, None, 3.0], "bools": [True, False, True]}
+    )
+    out = pl.from_pandas(df)
+    assert out.shape == (3, 3)
+    assert out.dtypes == [pl.Int64, pl.Float64, pl.Boolean]
+    assert out["floats"].null_count() == 1
+
+
+def test_from_pandas_strings():
+    df = pd.DataFrame(
+        {
+            "object": pd.Series(["foo", None, "ham"], dtype=object),
+            "string": pd.Series(["foo", None, "ham"], dtype="string"),
+        }
+    )
+    out = pl.from_pandas(df)
+    assert out["object"].dtype == pl.Utf8
+    assert out["string"].dtype == pl.Utf8
+    assert out["string"].to_list() == ["foo", None, "ham"]
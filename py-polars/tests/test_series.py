@@ -184,6 +184,10 @@ def test_arrow():
         == pl.List
     )
 
+    s = pl.from_arrow(pa.chunked_array([[1, 2], [3]]))
+    assert s.dtype == pl.Int64
+    assert s.to_list() == [1, 2, 3]
+
 
 def test_view():
     a = pl.Series("a", [1.0, 2.0, 3.0])
@@ -283,6 +287,21 @@ def test_repeat():
     s = pl.repeat("foo", 10)
     assert s.dtype == pl.Utf8
     assert s.len() == 10
+    s = pl.repeat(1.0, 5, name="foo")
+    assert s.dtype == pl.Float64
+    assert s.name == "foo"
+    assert s.to_list() == [1.0] * 5
+    s = pl.repeat(True, 5)
+    assert s.dtype == pl.Boolean
+    assert s.to_list() == [True] * 5
+    s = pl.repeat(np.bool_(True), 5)
+    assert s.dtype == pl.Boolean
+    s = pl.repeat(np.int32(1), 5)
+    assert s.dtype == pl.Int64
+    with pytest.raises(TypeError):
+        pl.repeat(2 ** 64, 5)
+    with pytest.raises(TypeError):
+        pl.repeat(None, 5)
 
 
 def test_median():